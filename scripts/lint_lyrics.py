@@ -5,12 +5,27 @@ Reference: https://community.musixmatch.com/guidelines?lng=en#format
 """
 
 import json
+import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-
-import ass
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ass import Comment, Dialogue
 
 # Error code definitions
 ERROR_CODES = {
@@ -84,10 +99,83 @@ ERROR_CODES = {
     },
 }
 
+# Per-code fields shared by every serialized LintError
+_ERROR_CODE_FIELDS = {
+    code: {"code": code, "message": d["message"], "level": d["level"]}
+    for code, d in ERROR_CODES.items()
+}
+
+# Fewest files worth handing to a worker process; smaller batches run serially
+FILES_PER_WORKER = 32
+
+# Precompiled patterns used by the per-line checks. Patterns that only match
+# ASCII classes against whitespace-collapsed text use re.ASCII; those relying
+# on Unicode digits, word boundaries or case folding keep the default.
+_RE_ASS_TAG = re.compile(r"\{[^}]*\}")
+_TRAILING_COMMAS = (",", "、")
+_TRAILING_PERIODS = (".", "。")
+_RE_ACRONYM_PERIOD = re.compile(r"[A-Z]\.", re.ASCII)
+# Every MX203 match starts with two adjacent marks, so this cheaper scan finds
+# where the full pattern needs to start searching
+_RE_PUNCT_PAIR = re.compile(r"[.!?]{2}")
+_RE_MULTIPLE_PUNCT = re.compile(
+    r"(?<!\.)\.\.(?!\.)|\.{4,}|[!?]{2,}|[!?]\.(?!\.)|\.\.?[!?]"
+)
+_SPACING_PUNCT_CHARS = frozenset(",.!?;:")
+_RE_SPACE_BEFORE_PUNCT = re.compile(r"\s+[,.!?;:]", re.ASCII)
+_RE_MISSING_SPACE_AFTER_PUNCT = re.compile(r"[,.!?;:][a-zA-Z]", re.ASCII)
+_RE_MULTIPLE_SPACES = re.compile(r"  +")
+_RE_SMART_QUOTES = re.compile("[\u201c\u201d\u201e\u201f]")
+_RE_SQUARE_BRACKETS = re.compile(r"[\[\]]")
+_RE_ASTERISK_CENSOR = re.compile(r"\*\*+")
+_RE_MULTIPLIER = re.compile(r"\([xX×]\s*\d+\)")
+_RE_STRUCTURE_LABEL = re.compile(
+    r"\((Verse|Chorus|Bridge|Intro|Outro|Hook|Pre-Chorus)[\s\-][^)]*\)",
+    re.IGNORECASE,
+)
+_RE_SOUND_EFFECT = re.compile(r"\*[^*]+\*")
+_RE_OVERRIDE_TAG = re.compile(r"\{\\[^}]+\}")
+_RE_KARAOKE_TAG = re.compile(r"\\[kK]")
+_RE_QUOTE_CAPITAL = re.compile(r'"[A-Z]', re.ASCII)
+_RE_COMMA_QUOTE_CAPITAL = re.compile(r',\s*"[A-Z]', re.ASCII)
+
+# Capitalization exceptions (MX101, MX102)
+_LOWERCASE_BRAND_NAMES = ("iPhone", "iPad", "eBay")
+_ALLOWED_ACRONYMS = frozenset({"DJ", "TV", "USA", "UK", "NYC", "LA"})
+
+# Number words that must be written numerically (MX501)
+_NUMBER_WORDS = {
+    "eleven": 11,
+    "twelve": 12,
+    "thirteen": 13,
+    "fourteen": 14,
+    "fifteen": 15,
+    "sixteen": 16,
+    "seventeen": 17,
+    "eighteen": 18,
+    "nineteen": 19,
+    "twenty": 20,
+    "thirty": 30,
+    "forty": 40,
+    "fifty": 50,
+    "sixty": 60,
+    "seventy": 70,
+    "eighty": 80,
+    "ninety": 90,
+    "hundred": 100,
+    "thousand": 1000,
+    "million": 1000000,
+}
+_RE_NUMBER_WORDS = re.compile(
+    r"\b(" + "|".join(w for w, v in _NUMBER_WORDS.items() if v > 10) + r")\b"
+)
+
 
 class LintError:
     """Represents a linting error with code and details."""
 
+    __slots__ = ("code", "line_num", "context", "full_line", "error_def", "is_warning")
+
     def __init__(
         self, code: str, line_num: int, context: str = "", full_line: str = ""
     ):
@@ -106,17 +194,83 @@ class LintError:
         """Convert LintError to dictionary for JSON serialization."""
         return {
             "line": self.line_num,
-            "code": self.code,
-            "message": self.error_def["message"],
-            "level": self.error_def["level"],
+            **_ERROR_CODE_FIELDS[self.code],
             "context": self.context,
             "full_line": self.full_line,
         }
 
 
+# Event line types the linter reads; other valid types are skipped
+_EVENT_TYPES = {"dialogue": Dialogue, "comment": Comment}
+_SKIPPED_EVENT_TYPES = frozenset({"picture", "sound", "movie", "command"})
+
+
+def read_events(lines: Iterable[str]) -> List[Union[Dialogue, Comment]]:
+    """Read Dialogue and Comment events from the lines of an ASS file.
+
+    Follows the line handling and structural errors of ``ass.parse``, but
+    only tokenizes the [Events] section and keeps just the Effect and Text
+    fields instead of converting every timing, style and margin field. Field
+    names are matched case-insensitively, so ``text`` is read like ``Text``.
+    """
+    events: List[Union[Dialogue, Comment]] = []
+    section = None
+    field_order = [field.lower() for field in Dialogue.DEFAULT_FIELD_ORDER]
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(";"):
+            continue
+
+        if line.startswith("[") and line.endswith("]"):
+            section = line[1:-1]
+            continue
+
+        if section is None:
+            raise ValueError("Content outside of any section.")
+
+        if section.lower() != "events" or ":" not in line:
+            continue
+
+        type_name, _, line = line.partition(":")
+        type_key = type_name.lower()
+        if type_key == "format":
+            field_order = [field.strip().lower() for field in line.split(",")]
+            continue
+
+        event_type = _EVENT_TYPES.get(type_key)
+        if event_type is None and type_key not in _SKIPPED_EVENT_TYPES:
+            raise ValueError(f"unexpected {type_name} line in {section}")
+
+        parts = line.lstrip().split(",", len(field_order) - 1)
+        if len(parts) != len(field_order):
+            raise ValueError("arity of line does not match arity of field order")
+
+        if event_type is not None:
+            fields = dict(zip(field_order, parts))
+            events.append(
+                event_type(effect=fields.get("effect", ""), text=fields.get("text", ""))
+            )
+
+    return events
+
+
 class MusixmatchLyricsLinter:
     """Linter for ASS lyrics files following Musixmatch guidelines."""
 
+    # Rule codes each per-line check can report
+    _CHECK_CODES = {
+        "capitalization": frozenset({"MX101", "MX102", "MX103"}),
+        "punctuation": frozenset({"MX201", "MX202", "MX203", "MX204", "MX205"}),
+        "formatting": frozenset({"MX301", "MX302", "MX303", "MX304"}),
+        "special_characters": frozenset({"MX401", "MX402"}),
+        "line_breaks": frozenset({"MX305"}),
+        "numbers": frozenset({"MX501"}),
+        "multipliers": frozenset({"MX601"}),
+        "non_vocal_content": frozenset({"MX701", "MX702", "MX306"}),
+        "direct_speech": frozenset({"MX801", "MX802"}),
+    }
+
     def __init__(self, file_path: Path, disabled_rules: Optional[Set[str]] = None):
         self.file_path = file_path
         self.lint_errors: List[LintError] = []
@@ -124,30 +278,31 @@ class MusixmatchLyricsLinter:
         self.disabled_rules_file: Set[str] = set()
         self.enabled_rules_file: Set[str] = set()
         self.all_rules_disabled_file = False
+        self.disabled_rules_effective: Set[str] = set()
+        self._update_effective_rules()
 
         try:
-            with open(file_path, "r", encoding="utf-8-sig") as f:
-                self.doc = ass.parse(f)
+            data = file_path.read_bytes().decode("utf-8-sig")
+            if "\r" in data:
+                data = data.replace("\r\n", "\n").replace("\r", "\n")
+            self.events = read_events(data.split("\n"))
         except Exception as e:
             self.lint_errors.append(LintError("MX000", 0, str(e)))
-            self.doc = None
+            self.events = None
 
     def lint(self) -> Tuple[List[LintError], List[LintError]]:
         """Run all linting checks."""
-        if self.doc is None:
+        if self.events is None:
             return self._format_output()
 
         self._process_all_events()
 
         return self._format_output()
 
-    def _process_file_wide_directive(self, event: Any):
+    def _process_file_wide_directive(self, event: Comment):
         """Process file-wide lint suppression directives from Comment events."""
-        if type(event).__name__ != "Comment":
-            return
-
-        effect = event.effect.strip().lower() if hasattr(event, "effect") else ""
-        text = self.strip_ass_tags(event.text).strip() if hasattr(event, "text") else ""
+        effect = event.effect.strip().lower()
+        text = self.strip_ass_tags(event.text)
 
         if effect == "lint-disable":
             if not text:
@@ -163,42 +318,35 @@ class MusixmatchLyricsLinter:
                 rules = [r.upper() for r in text.split()]
                 self.enabled_rules_file.update(rules)
                 self.disabled_rules_file.difference_update(rules)
+        else:
+            return
+
+        self._update_effective_rules()
+
+    def _update_effective_rules(self):
+        """Recompute the rules disabled globally or file-wide."""
+        disabled = set(self.disabled_rules_global)
+        if self.all_rules_disabled_file:
+            disabled.update(ERROR_CODES.keys() - self.enabled_rules_file)
+        disabled.update(self.disabled_rules_file - self.enabled_rules_file)
+        self.disabled_rules_effective = disabled
 
     def _is_rule_disabled(self, rule_code: str, line_suppressions: Set[str]) -> bool:
         """Check if a rule is disabled globally, file-wide, or on this line."""
-        if self.all_rules_disabled_file and rule_code not in self.enabled_rules_file:
-            return True
-        if rule_code in self.disabled_rules_global:
-            return True
-        if (
-            rule_code in self.disabled_rules_file
-            and rule_code not in self.enabled_rules_file
-        ):
-            return True
-        if rule_code in line_suppressions:
-            return True
-        return False
+        return (
+            rule_code in self.disabled_rules_effective or rule_code in line_suppressions
+        )
 
-    def _get_line_suppressions(self, event: Any) -> Set[str]:
+    def _get_line_suppressions(self, event: Dialogue) -> Set[str]:
         """Extract suppression rules from the effect field (noqa or skip-XXX)."""
-        suppressions: Set[str] = set()
-        if not hasattr(event, "effect"):
-            return suppressions
-
-        effect = event.effect.strip()
+        effect = event.effect.strip().lower()
         if not effect:
-            return suppressions
+            return set()
 
-        if effect.lower() == "noqa":
+        if effect == "noqa":
             return {"*"}
 
-        parts = effect.split()
-        for part in parts:
-            if part.lower().startswith("skip-"):
-                rule = part[5:].upper()
-                suppressions.add(rule)
-
-        return suppressions
+        return {part[5:].upper() for part in effect.split() if part.startswith("skip-")}
 
     def _add_error(
         self,
@@ -217,120 +365,160 @@ class MusixmatchLyricsLinter:
         """Process all events in a single loop."""
         dialogue_line_num = 0
 
-        for event in self.doc.events:
-            # Process file-wide directives
-            self._process_file_wide_directive(event)
-
-            # Process dialogue events
-            if type(event).__name__ != "Dialogue":
+        for event in self.events:
+            # Dialogue is the common case; only other events are tested for Comment
+            if not isinstance(event, Dialogue):
+                # Process file-wide directives
+                if isinstance(event, Comment):
+                    self._process_file_wide_directive(event)
                 continue
 
             dialogue_line_num += 1
 
-            # Get text before ASS tag stripping for certain checks
-            text_raw = re.sub(r"\{[^}]*\}", "", event.text)
-            text_raw = text_raw.replace("\\N", " ").replace("\\n", " ")
-
-            text = self.strip_ass_tags(event.text)
-            if not text.strip():
+            # Strip tags once; keep the uncollapsed spacing for certain checks
+            text_raw = self.remove_ass_tags(event.text)
+            text = self.collapse_whitespace(text_raw)
+            if not text:
                 continue
 
             line_suppressions = self._get_line_suppressions(event)
+            if "*" in line_suppressions:
+                continue
 
-            self._check_capitalization_line(dialogue_line_num, text, line_suppressions)
-            self._check_punctuation_line(dialogue_line_num, text, line_suppressions)
-            self._check_formatting_line(
-                dialogue_line_num, text, text_raw, line_suppressions
-            )
-            self._check_special_characters_line(
-                dialogue_line_num, text, line_suppressions
-            )
-            self._check_line_breaks_line(
-                dialogue_line_num, text, event.text, line_suppressions
-            )
-            self._check_numbers_line(dialogue_line_num, text, line_suppressions)
-            self._check_multipliers_line(dialogue_line_num, text, line_suppressions)
-            self._check_censorship_line(dialogue_line_num, text, line_suppressions)
-            self._check_non_vocal_content_line(
-                dialogue_line_num, text, line_suppressions, event.text
-            )
-            self._check_direct_speech_line(dialogue_line_num, text, line_suppressions)
+            # Skip whole checks when every rule they report is disabled
+            disabled = self.disabled_rules_effective
+            if line_suppressions:
+                disabled = disabled | line_suppressions
+            codes = self._CHECK_CODES
+
+            if not codes["capitalization"] <= disabled:
+                self._check_capitalization_line(
+                    dialogue_line_num, text, line_suppressions
+                )
+            if not codes["punctuation"] <= disabled:
+                self._check_punctuation_line(dialogue_line_num, text, line_suppressions)
+            if not codes["formatting"] <= disabled:
+                self._check_formatting_line(
+                    dialogue_line_num, text, text_raw, line_suppressions
+                )
+            if not codes["special_characters"] <= disabled:
+                self._check_special_characters_line(
+                    dialogue_line_num, text, line_suppressions
+                )
+            if not codes["line_breaks"] <= disabled:
+                self._check_line_breaks_line(
+                    dialogue_line_num, text, event.text, line_suppressions
+                )
+            if not codes["numbers"] <= disabled:
+                self._check_numbers_line(dialogue_line_num, text, line_suppressions)
+            if not codes["multipliers"] <= disabled:
+                self._check_multipliers_line(dialogue_line_num, text, line_suppressions)
+            if not codes["non_vocal_content"] <= disabled:
+                self._check_non_vocal_content_line(
+                    dialogue_line_num, text, line_suppressions, event.text
+                )
+            if not codes["direct_speech"] <= disabled:
+                self._check_direct_speech_line(
+                    dialogue_line_num, text, line_suppressions
+                )
 
     def _format_output(self) -> Tuple[List["LintError"], List["LintError"]]:
         """Format errors and warnings for output."""
-        errors = [e for e in self.lint_errors if not e.is_warning]
-        warnings = [e for e in self.lint_errors if e.is_warning]
+        errors: List[LintError] = []
+        warnings: List[LintError] = []
+        for lint_error in self.lint_errors:
+            (warnings if lint_error.is_warning else errors).append(lint_error)
         return errors, warnings
 
     def _check_capitalization_line(
         self, line_num: int, text: str, suppressions: Set[str]
     ):
         """Check capitalization rules for a single line."""
-        has_case_system = any(c.isupper() or c.islower() for c in text if c.isalpha())
+        # Uncased scripts (e.g. CJK) have nothing to check here; rule them out
+        # in C before scanning characters. Appending a cased letter makes both
+        # tests true only when no character in the line is upper or lowercase
+        if not text.isascii() and (text + "a").islower() and (text + "A").isupper():
+            return
+
+        # Single scan: find the first letter and stop at the first cased one
+        first_alpha = None
+        has_case_system = False
+        for c in text:
+            if not c.isalpha():
+                continue
+            if first_alpha is None:
+                first_alpha = c
+            if c.isupper() or c.islower():
+                has_case_system = True
+                break
 
         if not has_case_system:
             return
 
         # MX101: First letter must be capitalized
-        first_alpha = next((c for c in text if c.isalpha()), None)
         if first_alpha and not first_alpha.isupper() and not first_alpha.islower():
             pass
         elif text and text[0].isalpha() and not text[0].isupper():
-            if not any(text.startswith(p) for p in ["iPhone", "iPad", "eBay"]):
+            if not text.startswith(_LOWERCASE_BRAND_NAMES):
                 self._add_error("MX101", line_num, text[0], suppressions, text)
 
+        # Collect MX102 and MX103 candidates in a single pass over the words
+        all_caps_words = []
+        words_longer_than_3 = []
+        title_case_count = 0
+        for w in text.split():
+            if not w.isalpha():
+                continue
+            if len(w) > 1 and w.isupper() and w not in _ALLOWED_ACRONYMS:
+                all_caps_words.append(w)
+            if len(w) > 3:
+                words_longer_than_3.append(w)
+                if w[0].isupper():
+                    title_case_count += 1
+
         # MX102: Don't use all caps for emphasis
-        words = text.split()
-        all_caps_words = [
-            w
-            for w in words
-            if w.isupper()
-            and len(w) > 1
-            and w.isalpha()
-            and w not in ["DJ", "TV", "USA", "UK", "NYC", "LA"]
-        ]
-        if len(all_caps_words) > 0:
+        if all_caps_words:
             self._add_error(
                 "MX102", line_num, " ".join(all_caps_words), suppressions, text
             )
 
         # MX103: Don't capitalize every word (title case)
-        words_longer_than_3 = [w for w in words if len(w) > 3 and w.isalpha()]
-        if len(words_longer_than_3) > 2:
-            title_case_count = sum(1 for w in words_longer_than_3 if w[0].isupper())
-            if title_case_count == len(words_longer_than_3):
-                self._add_error(
-                    "MX103", line_num, " ".join(words_longer_than_3), suppressions, text
-                )
+        if len(words_longer_than_3) > 2 and title_case_count == len(
+            words_longer_than_3
+        ):
+            self._add_error(
+                "MX103", line_num, " ".join(words_longer_than_3), suppressions, text
+            )
 
     def _check_punctuation_line(self, line_num: int, text: str, suppressions: Set[str]):
         """Check punctuation rules for a single line."""
-        rstrip = text.rstrip()
-
         # MX201: Don't end lines with commas
-        if rstrip.endswith(",") or rstrip.endswith("、"):
-            self._add_error("MX201", line_num, rstrip[-1], suppressions, text)
+        if text.endswith(_TRAILING_COMMAS):
+            self._add_error("MX201", line_num, text[-1], suppressions, text)
 
         # MX202: Don't end lines with periods (except acronyms and ellipses)
-        if (rstrip.endswith(".") or rstrip.endswith("。")) and not re.search(
-            r"[A-Z]\.$|\.{3}$", rstrip
+        if text.endswith(_TRAILING_PERIODS) and not (
+            text.endswith("...") or _RE_ACRONYM_PERIOD.fullmatch(text[-2:])
         ):
-            self._add_error("MX202", line_num, rstrip[-1], suppressions, text)
+            self._add_error("MX202", line_num, text[-1], suppressions, text)
 
         # MX203: Don't use multiple punctuation marks
-        match = re.search(
-            r"(?<!\.)\.\.(?!\.)|\.{4,}|[!?]{2,}|[!?]\.(?!\.)|\.\.?[!?]", text
-        )
+        pair = _RE_PUNCT_PAIR.search(text)
+        match = pair and _RE_MULTIPLE_PUNCT.search(text, pair.start())
         if match:
             self._add_error("MX203", line_num, match.group(), suppressions, text)
 
+        # MX204 and MX205 both need one of these marks to be present
+        if _SPACING_PUNCT_CHARS.isdisjoint(text):
+            return
+
         # MX204: Remove space before punctuation
-        match = re.search(r"\s+[,.!?;:]", text)
+        match = _RE_SPACE_BEFORE_PUNCT.search(text)
         if match:
             self._add_error("MX204", line_num, match.group(), suppressions, text)
 
         # MX205: Add space after punctuation
-        match = re.search(r"[,.!?;:][a-zA-Z]", text)
+        match = _RE_MISSING_SPACE_AFTER_PUNCT.search(text)
         if match:
             self._add_error("MX205", line_num, match.group(), suppressions, text)
 
@@ -338,29 +526,28 @@ class MusixmatchLyricsLinter:
         self, line_num: int, text: str, text_raw: str, suppressions: Set[str]
     ):
         """Check text formatting rules for a single line."""
-        # MX301: Remove multiple consecutive spaces (check before strip_ass_tags normalization)
+        # MX301: Remove multiple consecutive spaces (check before collapse_whitespace)
         if "  " in text_raw:
-            match = re.search(r"  +", text_raw)
+            match = _RE_MULTIPLE_SPACES.search(text_raw)
             self._add_error(
                 "MX301", line_num, match.group() if match else "  ", suppressions, text
             )
 
-        # MX302: Remove leading/trailing spaces (check before strip_ass_tags normalization)
-        if text_raw != text_raw.strip():
+        # MX302: Remove leading/trailing spaces (check before collapse_whitespace)
+        if text_raw[:1].isspace() or text_raw[-1:].isspace():
             self._add_error("MX302", line_num, "", suppressions, text)
 
         # MX303: Use straight quotes instead of smart quotes
-        smart_quote_chars = '""""'
-        smart_quotes = [c for c in text if c in smart_quote_chars]
-        if smart_quotes:
-            self._add_error(
-                "MX303", line_num, "".join(smart_quotes), suppressions, text
-            )
+        if not text.isascii():
+            smart_quotes = _RE_SMART_QUOTES.findall(text)
+            if smart_quotes:
+                self._add_error(
+                    "MX303", line_num, "".join(smart_quotes), suppressions, text
+                )
 
         # MX304: Use Unicode ellipsis instead of three dots
-        match = re.search(r"\.{3}", text)
-        if match:
-            self._add_error("MX304", line_num, match.group(), suppressions, text)
+        if "..." in text:
+            self._add_error("MX304", line_num, "...", suppressions, text)
 
     def _check_special_characters_line(
         self, line_num: int, text: str, suppressions: Set[str]
@@ -368,12 +555,12 @@ class MusixmatchLyricsLinter:
         """Check for special characters and symbols for a single line."""
         # MX401: Don't use brackets in lyrics
         if "[" in text or "]" in text:
-            brackets = "".join([c for c in text if c in "[]"])
+            brackets = "".join(_RE_SQUARE_BRACKETS.findall(text))
             self._add_error("MX401", line_num, brackets, suppressions, text)
 
         # MX402: Don't censor with asterisks (merged from old MX401 and MX801)
-        match = re.search(r"\*\*+", text)
-        if match:
+        if "**" in text:
+            match = _RE_ASTERISK_CENSOR.search(text)
             self._add_error("MX402", line_num, match.group(), suppressions, text)
 
     def _check_line_breaks_line(
@@ -381,81 +568,47 @@ class MusixmatchLyricsLinter:
     ):
         """Check line break rules for a single line."""
         # MX305: Consider splitting multi-line lyrics
-        if "\\N" in raw_text or "\\n" in raw_text:
+        if "\\" in raw_text and ("\\N" in raw_text or "\\n" in raw_text):
             self._add_error("MX305", line_num, "", suppressions, text)
 
     def _check_numbers_line(self, line_num: int, text: str, suppressions: Set[str]):
         """Check number formatting for a single line."""
-        number_words = {
-            "eleven": 11,
-            "twelve": 12,
-            "thirteen": 13,
-            "fourteen": 14,
-            "fifteen": 15,
-            "sixteen": 16,
-            "seventeen": 17,
-            "eighteen": 18,
-            "nineteen": 19,
-            "twenty": 20,
-            "thirty": 30,
-            "forty": 40,
-            "fifty": 50,
-            "sixty": 60,
-            "seventy": 70,
-            "eighty": 80,
-            "ninety": 90,
-            "hundred": 100,
-            "thousand": 1000,
-            "million": 1000000,
-        }
-
-        text_lower = text.lower()
-
         # MX501: Write numbers over 10 numerically
-        for word, value in number_words.items():
-            if value > 10:
-                match = re.search(rf"\b{word}\b", text_lower)
-                if match:
-                    self._add_error("MX501", line_num, word, suppressions, text)
-                    break
+        match = _RE_NUMBER_WORDS.search(text.lower())
+        if match:
+            self._add_error("MX501", line_num, match.group(1), suppressions, text)
 
     def _check_multipliers_line(self, line_num: int, text: str, suppressions: Set[str]):
         """Check for multipliers for a single line."""
         # MX601: Don't use multipliers
-        match = re.search(r"\([xX×]\s*\d+\)", text)
-        if match:
-            self._add_error("MX601", line_num, match.group(), suppressions, text)
-
-    def _check_censorship_line(self, line_num: int, text: str, suppressions: Set[str]):
-        """Check censorship formatting for a single line."""
-        # Note: Censorship check now merged into MX402 in _check_special_characters_line
-        pass
+        if "(" in text:
+            match = _RE_MULTIPLIER.search(text)
+            if match:
+                self._add_error("MX601", line_num, match.group(), suppressions, text)
 
     def _check_non_vocal_content_line(
         self, line_num: int, text: str, suppressions: Set[str], raw_text: str = ""
     ):
         """Check for non-vocal content for a single line."""
         # MX701: Don't include structure labels
-        match = re.search(
-            r"\((Verse|Chorus|Bridge|Intro|Outro|Hook|Pre-Chorus)[\s\-][^)]*\)",
-            text,
-            re.IGNORECASE,
-        )
-        if match:
-            self._add_error("MX701", line_num, match.group(), suppressions, text)
+        if "(" in text:
+            match = _RE_STRUCTURE_LABEL.search(text)
+            if match:
+                self._add_error("MX701", line_num, match.group(), suppressions, text)
 
         # MX702: Don't include sound effect descriptions
-        match = re.search(r"\*[^*]+\*", text)
-        if match:
-            self._add_error("MX702", line_num, match.group(), suppressions, text)
+        if "*" in text:
+            match = _RE_SOUND_EFFECT.search(text)
+            if match:
+                self._add_error("MX702", line_num, match.group(), suppressions, text)
 
         # MX306: Don't use ASS override tags (except karaoke tags)
-        if raw_text:
+        if "{\\" in raw_text:
             # Find all ASS override tags
-            for match in re.finditer(r"\{\\[^}]+\}", raw_text):
+            for match in _RE_OVERRIDE_TAG.finditer(raw_text):
                 tag_content = match.group()
                 # Allow karaoke tags: \k, \K, \kf, \ko, etc.
-                if not re.search(r"\\[kK]", tag_content):
+                if not _RE_KARAOKE_TAG.search(tag_content):
                     self._add_error(
                         "MX306", line_num, tag_content, suppressions, raw_text
                     )
@@ -468,24 +621,114 @@ class MusixmatchLyricsLinter:
             return
 
         # MX801: Direct speech should follow a comma (warning)
-        match = re.search(r'"[A-Z]', text)
-        if match and not re.search(r',\s*"[A-Z]', text):
+        match = _RE_QUOTE_CAPITAL.search(text)
+        if match and not _RE_COMMA_QUOTE_CAPITAL.search(text):
             if not text.strip().startswith('"'):
                 self._add_error("MX801", line_num, match.group(), suppressions, text)
 
         # MX802: Direct speech must start with capital letter
-        quotes = re.findall(r'"([^"]+)"', text)
-        for quote in quotes:
-            if quote and quote[0].isalpha() and not quote[0].isupper():
+        # Quoted spans sit at odd indices of the split; an empty span ("")
+        # cannot be matched, so its closing quote opens the next span instead.
+        parts = text.split('"')
+        i = 1
+        while i < len(parts) - 1:
+            quote = parts[i]
+            if not quote:
+                i += 1
+                continue
+            if quote[0].isalpha() and not quote[0].isupper():
                 self._add_error("MX802", line_num, f'"{quote}"', suppressions, text)
+            i += 2
 
     @staticmethod
-    def strip_ass_tags(text: str) -> str:
+    def remove_ass_tags(text: str) -> str:
+        """Remove ASS formatting tags and line breaks, keeping original spacing."""
+        if "{" in text:
+            text = _RE_ASS_TAG.sub("", text)
+        if "\\" in text:
+            text = text.replace("\\N", " ").replace("\\n", " ")
+        return text
+
+    @staticmethod
+    def collapse_whitespace(text: str) -> str:
+        """Collapse whitespace runs into single spaces and trim the ends."""
+        # Every whitespace character but " " is non-printable, so a printable
+        # line without doubled or edge spaces is already collapsed
+        if (
+            text.isprintable()
+            and "  " not in text
+            and not text.startswith(" ")
+            and not text.endswith(" ")
+        ):
+            return text
+        return " ".join(text.split())
+
+    @classmethod
+    def strip_ass_tags(cls, text: str) -> str:
         """Remove ASS formatting tags from text."""
-        text = re.sub(r"\{[^}]*\}", "", text)
-        text = text.replace("\\N", " ").replace("\\n", " ")
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        return cls.collapse_whitespace(cls.remove_ass_tags(text))
+
+
+def find_ass_files(root: Path) -> Iterator[Path]:
+    """Recursively yield ASS files under root using cached directory entries."""
+    # Skip unreadable directories silently, as Path.rglob does
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_ass_files(Path(entry.path))
+            elif entry.name.endswith(".ass") and entry.is_file():
+                yield Path(entry.path)
+
+
+def _lint_file(
+    ass_file: Path, disabled_rules: Set[str]
+) -> Tuple[Path, List[LintError], List[LintError]]:
+    """Lint a single file (module-level so worker processes can pickle it)."""
+    errors, warnings = MusixmatchLyricsLinter(ass_file, disabled_rules).lint()
+    return ass_file, errors, warnings
+
+
+def _file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def lint_files(
+    ass_files: List[Path], disabled_rules: Set[str]
+) -> Iterator[Tuple[Path, List[LintError], List[LintError]]]:
+    """Lint files in order, spreading large batches across worker processes."""
+    workers = min(os.cpu_count() or 1, len(ass_files) // FILES_PER_WORKER)
+    if workers < 2:
+        for ass_file in ass_files:
+            yield _lint_file(ass_file, disabled_rules)
+        return
+
+    # Start the largest files first so a big file does not hold up the tail,
+    # then hand the results back in the order they were requested
+    order = sorted(
+        range(len(ass_files)), key=lambda i: _file_size(ass_files[i]), reverse=True
+    )
+    results: List[Any] = [None] * len(ass_files)
+    chunksize = max(1, len(ass_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, result in zip(
+            order,
+            executor.map(
+                _lint_file,
+                [ass_files[i] for i in order],
+                repeat(disabled_rules),
+                chunksize=chunksize,
+            ),
+        ):
+            results[i] = result
+    yield from results
 
 
 def list_error_codes():
@@ -619,7 +862,7 @@ Examples:
         if not ass_dir.exists():
             console.print(f"[red]Error:[/red] Directory '{ass_dir}' not found")
             sys.exit(1)
-        ass_files = list(ass_dir.rglob("*.ass"))
+        ass_files = list(find_ass_files(ass_dir))
 
     if not ass_files:
         console.print("[yellow]No ASS files found[/yellow]")
@@ -637,10 +880,7 @@ Examples:
     files_with_issues = 0
     all_issues = []
 
-    for ass_file in sorted(ass_files):
-        linter = MusixmatchLyricsLinter(ass_file, disabled_rules)
-        errors, warnings = linter.lint()
-
+    for ass_file, errors, warnings in lint_files(sorted(ass_files), disabled_rules):
         if errors or warnings:
             files_with_issues += 1
             all_issues.append((ass_file, errors, warnings))
@@ -649,47 +889,41 @@ Examples:
 
     # JSON output
     if args.json:
-        output = {
-            "summary": {
-                "files_checked": len(ass_files),
-                "files_with_issues": files_with_issues,
-                "total_errors": total_errors,
-                "total_warnings": total_warnings,
-            },
-            "files": [],
+        summary = {
+            "files_checked": len(ass_files),
+            "files_with_issues": files_with_issues,
+            "total_errors": total_errors,
+            "total_warnings": total_warnings,
         }
 
-        for ass_file, errors, warnings in all_issues:
+        # Stream one file entry at a time instead of building the whole document
+        out = sys.stdout
+        out.write(f'{{"summary": {json.dumps(summary)}, "files": [')
+        for i, (ass_file, errors, warnings) in enumerate(all_issues):
             file_data = {
                 "path": str(ass_file),
                 "errors": [e.to_dict() for e in errors],
                 "warnings": [w.to_dict() for w in warnings],
             }
-            output["files"].append(file_data)
-
-        print(json.dumps(output))
+            if i:
+                out.write(", ")
+            out.write(json.dumps(file_data))
+        out.write("]}\n")
         sys.exit(1 if total_errors > 0 else 0)
 
     # Display issues grouped by file
     for ass_file, errors, warnings in all_issues:
-        console.print(f"\n[bold cyan]📄 {ass_file}[/bold cyan]\n")
+        # Collect the file's report and render it with a single print
+        report = [f"\n[bold cyan]📄 {ass_file}[/bold cyan]\n"]
 
         # Group by line number for cleaner display
-        issues_by_line = {}
-
-        for error in errors:
-            if error.line_num not in issues_by_line:
-                issues_by_line[error.line_num] = []
-            issues_by_line[error.line_num].append(error)
-
-        for warning in warnings:
-            if warning.line_num not in issues_by_line:
-                issues_by_line[warning.line_num] = []
-            issues_by_line[warning.line_num].append(warning)
+        issues_by_line: DefaultDict[int, List[LintError]] = defaultdict(list)
+        for issue in chain(errors, warnings):
+            issues_by_line[issue.line_num].append(issue)
 
         # Display issues line by line
         for line_num in sorted(issues_by_line.keys()):
-            console.print(f"Line [bold cyan]{line_num}[/bold cyan]")
+            report.append(f"Line [bold cyan]{line_num}[/bold cyan]")
             for lint_error in issues_by_line[line_num]:
                 issue_type = "warning" if lint_error.is_warning else "error"
                 color = "red" if issue_type == "error" else "yellow"
@@ -716,32 +950,31 @@ Examples:
                         line_with_highlight = (
                             f"{before}[bold {color}]{issue}[/bold {color}]{after}"
                         )
-                        console.print(
-                            f"  [{color}]{symbol} {code}[/{color}]: {line_with_highlight}",
-                            highlight=False,
+                        report.append(
+                            f"  [{color}]{symbol} {code}[/{color}]: {line_with_highlight}"
                         )
                     else:
                         # Fallback if not found
                         full_line_escaped = full_line.replace("[", "\\[").replace(
                             "]", "\\]"
                         )
-                        console.print(
-                            f"  [{color}]{symbol} {code}[/{color}]: {full_line_escaped}",
-                            highlight=False,
+                        report.append(
+                            f"  [{color}]{symbol} {code}[/{color}]: {full_line_escaped}"
                         )
                 else:
                     # If no highlighted issue or can't find it, just show the full line
                     full_line_escaped = full_line.replace("[", "\\[").replace(
                         "]", "\\]"
                     )
-                    console.print(
-                        f"  [{color}]{symbol} {code}[/{color}]: {full_line_escaped}",
-                        highlight=False,
+                    report.append(
+                        f"  [{color}]{symbol} {code}[/{color}]: {full_line_escaped}"
                     )
 
                 # Show the lint message below if available
                 if lint_msg:
-                    console.print(f"         [dim]> {lint_msg}[/dim]", highlight=False)
+                    report.append(f"         [dim]> {lint_msg}[/dim]")
+
+        console.print("\n".join(report), highlight=False)
 
     # Summary
     console.print()